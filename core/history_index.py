@@ -0,0 +1,92 @@
+"""
+Sidecar index of discovery files so the history view can list them without parsing each one
+"""
+import os
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional
+
+from . import json_compat
+
+# Kept beside the discoveries folder, not in it, since other tools treat
+# every *.json in that folder as a discovery file
+INDEX_FILENAME = 'history_index.json'
+
+
+def index_path(discoveries_dir: Path) -> Path:
+    """Path of the index for a discoveries folder"""
+    return Path(discoveries_dir).parent / INDEX_FILENAME
+
+
+@lru_cache(maxsize=None)
+def _format_seconds(seconds: int) -> str:
+    return time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(seconds))
+
+
+def format_mtime(mtime: float) -> str:
+    """Format a file mtime for display, memoized per whole second"""
+    return _format_seconds(int(mtime))
+
+
+def count_public_params(params) -> int:
+    """Count parameter names not starting with an underscore"""
+    if isinstance(params, dict):
+        return sum(1 for k in params if not k.startswith('_'))
+    return 0
+
+
+def count_parameters(data: Dict) -> int:
+    """Count public parameters in a discovery file's data"""
+    discovery = data.get('discovery')
+    if isinstance(discovery, dict) and 'parameters' in discovery:
+        params = discovery['parameters']
+    else:
+        params = data.get('parameters', {})
+    return count_public_params(params)
+
+
+def make_entry(file_path: Path, name: str, param_count: int,
+               timestamp: Optional[str] = None, mtime: Optional[float] = None) -> Dict:
+    """Build an index entry for a discovery file"""
+    if mtime is None:
+        mtime = file_path.stat().st_mtime
+    if timestamp is None:
+        timestamp = format_mtime(mtime)
+    return {
+        'name': name,
+        'timestamp': timestamp,
+        'param_count': param_count,
+        'mtime': mtime
+    }
+
+
+def load_index(discoveries_dir: Path) -> Dict:
+    """Load the index, returning an empty one if missing or unreadable"""
+    try:
+        with open(index_path(discoveries_dir), 'rb') as f:
+            index = json_compat.loads(f.read())
+        return index if isinstance(index, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def save_index(discoveries_dir: Path, index: Dict):
+    """Write the index atomically so readers never see a partial file"""
+    path = index_path(discoveries_dir)
+    data = json_compat.dumps(index, indent=True)
+    # A temp file per write, since the analysis worker and the history
+    # viewer can both save at once
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=INDEX_FILENAME + '.',
+                                     suffix='.tmp', delete=False) as f:
+        f.write(data)
+    os.replace(f.name, path)
+
+
+def update_index(discoveries_dir: Path, file_path: Path, name: str, param_count: int,
+                 timestamp: Optional[str] = None):
+    """Add or refresh a single file's entry in the index"""
+    index = load_index(discoveries_dir)
+    index[Path(file_path).name] = make_entry(Path(file_path), name, param_count, timestamp)
+    save_index(discoveries_dir, index)
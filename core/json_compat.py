@@ -0,0 +1,56 @@
+"""
+JSON helpers that use orjson when it is installed, falling back to the stdlib
+"""
+import json
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Parse JSON from bytes or str"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson is stricter (e.g. NaN literals written by json.dump);
+            # let the stdlib decide so behaviour matches older files
+            pass
+    return json.loads(data)
+
+
+def _has_non_finite(obj) -> bool:
+    """True if obj holds a NaN or infinite float in its dicts and lists"""
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, float):
+            if not math.isfinite(item):
+                return True
+        elif isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return False
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, optionally indented by two spaces"""
+    # orjson writes NaN and +/-Infinity as null; json.dumps keeps them as
+    # the literals older files (and loads above) use
+    if orjson is not None and not _has_non_finite(obj):
+        # Session discoveries can hold numpy values and non-str keys; keep
+        # them on the fast path like json.dumps would accept them
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, option=option)
+        except TypeError:
+            # Types orjson can't serialize (e.g. non-contiguous arrays,
+            # arbitrary objects) take the stdlib path
+            pass
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
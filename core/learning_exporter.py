@@ -6,6 +6,7 @@ import numpy as np
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any
+from .history_index import count_parameters, update_index
 
 
 class SafeJSONEncoder(json.JSONEncoder):
@@ -266,12 +267,20 @@ class LearningExporter:
         
         # Clean plugin name for filename
         safe_name = plugin_name.replace('/', '_').replace('\\', '_')
-        filename = f'{safe_name}_enhanced_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+        now = datetime.now()
+        filename = f'{safe_name}_enhanced_{now.strftime("%Y%m%d_%H%M%S")}.json'
         filepath = self.discoveries_dir / filename
         
         with open(filepath, 'w') as f:
             json.dump(enhanced_data, f, indent=2, cls=SafeJSONEncoder)
         
+        # Keep the history index in sync so the viewer needn't parse this file
+        try:
+            update_index(self.discoveries_dir, filepath, safe_name, count_parameters(enhanced_data),
+                         timestamp=now.strftime("%Y-%m-%d %H:%M:%S"))
+        except Exception as e:
+            print(f"Warning: could not update history index: {e}")
+        
         return str(filepath)
     
     def create_markdown_report(self, report_data: Dict) -> str:
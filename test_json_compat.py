@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Test that JSON read and written through core.json_compat keeps its values
+"""
+import math
+
+from core import json_compat
+
+print("Testing JSON round-trips...")
+print("="*50)
+
+# Test 1: Non-finite floats as written by json.dump
+print("\n1. Testing -Infinity/NaN round-trip...")
+text = b'{"range": [-Infinity, 0.0], "default": NaN, "max": Infinity}'
+try:
+    data = json_compat.loads(text)
+    again = json_compat.loads(json_compat.dumps(data, indent=True))
+    if (again['range'] == [-math.inf, 0.0] and math.isnan(again['default'])
+            and again['max'] == math.inf):
+        print("✅ Non-finite floats survive loads and dumps")
+    else:
+        print(f"❌ Values changed on round-trip: {again}")
+except Exception as e:
+    print(f"❌ Round-trip failed: {e}")
+
+# Test 2: Ordinary data keeps its values
+print("\n2. Testing plain data round-trip...")
+plain = {'plugin': 'Test', 'parameters': {'Mix': {'range': [0.0, 1.0], 'steps': 101}}}
+try:
+    if json_compat.loads(json_compat.dumps(plain)) == plain:
+        print("✅ Plain data survives loads and dumps")
+    else:
+        print("❌ Plain data changed on round-trip")
+except Exception as e:
+    print(f"❌ Round-trip failed: {e}")
@@ -4,6 +4,7 @@ Parameter inspector component
 
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 import json
 
 class ParameterInspector(ttk.Frame):
@@ -23,21 +24,59 @@ class ParameterInspector(ttk.Frame):
         self.overview_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.overview_frame, text="Overview")
         
-        # Create overview text
-        self.overview_text = tk.Text(self.overview_frame, wrap=tk.WORD)
-        self.overview_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Header font is created once and shared by the text tabs
+        self.header_font = tkfont.Font(family='Arial', size=12, weight='bold')
+        
+        # Create overview summary table
+        self.overview_tree = ttk.Treeview(self.overview_frame, columns=('count', 'priority'),
+                                          show='tree headings')
+        self.overview_tree.heading('#0', text='Summary')
+        self.overview_tree.heading('count', text='Parameters')
+        self.overview_tree.heading('priority', text='Priority')
+        self.overview_tree.column('#0', width=250)
+        self.overview_tree.column('count', width=100)
+        self.overview_tree.column('priority', width=100)
+        self.overview_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
         # Category tabs will be added dynamically
         self.category_tabs = {}
+        self.category_rows = {}
+        
+        # Single treeview shared by all category tabs; it is re-packed into
+        # whichever category frame is selected
+        self.param_tree = ttk.Treeview(self, columns=('Type', 'Range', 'Default', 'Unit'), show='tree headings')
+        self.param_tree.heading('#0', text='Parameter')
+        self.param_tree.heading('Type', text='Type')
+        self.param_tree.heading('Range', text='Range/Values')
+        self.param_tree.heading('Default', text='Default')
+        self.param_tree.heading('Unit', text='Unit')
+        
+        # Configure columns
+        self.param_tree.column('#0', width=200)
+        self.param_tree.column('Type', width=100)
+        self.param_tree.column('Range', width=150)
+        self.param_tree.column('Default', width=100)
+        self.param_tree.column('Unit', width=60)
+        
+        # Add scrollbar
+        self.param_scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.param_tree.yview)
+        self.param_tree.configure(yscrollcommand=self.param_scrollbar.set)
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
     
     def clear(self):
         """Clear all parameter data"""
-        self.overview_text.delete(1.0, tk.END)
+        self.overview_tree.delete(*self.overview_tree.get_children())
         
         # Remove category tabs
         for tab_id in list(self.category_tabs.keys()):
             self.notebook.forget(self.category_tabs[tab_id])
         self.category_tabs.clear()
+        self.category_rows.clear()
+        
+        self.param_tree.pack_forget()
+        self.param_scrollbar.pack_forget()
+        self.param_tree.delete(*self.param_tree.get_children())
     
     def load_parameters(self, categorized_data):
         """Load and display categorized parameters"""
@@ -60,29 +99,24 @@ class ParameterInspector(ttk.Frame):
     
     def _update_overview(self, data):
         """Update overview tab"""
-        self.overview_text.delete(1.0, tk.END)
+        tree = self.overview_tree
+        tree.delete(*tree.get_children())
         
         # Count parameters
         total_params = len(data['parameter_details'])
         categorized_count = sum(len(info['parameters']) for info in data['categories'].values())
         
         # Display summary
-        self.overview_text.insert(tk.END, "PARAMETER DISCOVERY OVERVIEW\n", 'header')
-        self.overview_text.insert(tk.END, "="*40 + "\n\n")
-        
-        self.overview_text.insert(tk.END, f"Total Parameters: {total_params}\n")
-        self.overview_text.insert(tk.END, f"Categorized: {categorized_count}\n")
-        self.overview_text.insert(tk.END, f"Uncategorized: {len(data['uncategorized'])}\n\n")
+        tree.insert('', 'end', text='Total Parameters', values=(total_params, ''))
+        tree.insert('', 'end', text='Categorized', values=(categorized_count, ''))
+        tree.insert('', 'end', text='Uncategorized', values=(len(data['uncategorized']), ''))
         
         # Category breakdown
-        self.overview_text.insert(tk.END, "Categories:\n", 'header')
+        categories_node = tree.insert('', 'end', text='Categories',
+                                      values=(len(data['categories']), ''), open=True)
         for category, info in data['categories'].items():
-            count = len(info['parameters'])
-            priority = info['priority']
-            self.overview_text.insert(tk.END, f"  • {category}: {count} params ({priority} priority)\n")
-        
-        # Configure tags
-        self.overview_text.tag_config('header', font=('Arial', 12, 'bold'))
+            tree.insert(categories_node, 'end', text=category,
+                        values=(len(info['parameters']), info['priority']))
     
     def _create_category_tab(self, category: str, info: dict, param_details: dict):
         """Create tab for a parameter category"""
@@ -90,22 +124,12 @@ class ParameterInspector(ttk.Frame):
         self.notebook.add(frame, text=category.replace('_', ' ').title())
         self.category_tabs[category] = frame
         
-        # Create treeview for parameters
-        tree = ttk.Treeview(frame, columns=('Type', 'Range', 'Default', 'Unit'), show='tree headings')
-        tree.heading('#0', text='Parameter')
-        tree.heading('Type', text='Type')
-        tree.heading('Range', text='Range/Values')
-        tree.heading('Default', text='Default')
-        tree.heading('Unit', text='Unit')
-        
-        # Configure columns
-        tree.column('#0', width=200)
-        tree.column('Type', width=100)
-        tree.column('Range', width=150)
-        tree.column('Default', width=100)
-        tree.column('Unit', width=60)
-        
-        # Add parameters
+        # Rows are formatted the first time the tab is selected
+        frame._pending = (info, param_details)
+    
+    def _format_category_rows(self, info: dict, param_details: dict) -> list:
+        """Build treeview rows for a parameter category"""
+        rows = []
         for param_name in info['parameters']:
             param_info = param_details.get(param_name, {})
             
@@ -117,21 +141,41 @@ class ParameterInspector(ttk.Frame):
             else:
                 range_str = "N/A"
             
-            tree.insert('', 'end', 
-                       text=param_name,
-                       values=(
-                           param_info.get('type', 'unknown'),
-                           range_str,
-                           param_info.get('default', 'N/A'),
-                           param_info.get('unit', '')
-                       ))
+            rows.append((param_name, (
+                param_info.get('type', 'unknown'),
+                range_str,
+                param_info.get('default', 'N/A'),
+                param_info.get('unit', '')
+            )))
+        return rows
+    
+    def _on_tab_changed(self, event=None):
+        """Move the shared treeview into the selected category tab"""
+        current = self.notebook.select()
+        self.param_tree.pack_forget()
+        self.param_scrollbar.pack_forget()
+        if not current:
+            return
         
-        tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        frame = self.notebook.nametowidget(current)
+        pending = getattr(frame, '_pending', None)
+        if pending is not None:
+            self.category_rows[current] = self._format_category_rows(*pending)
+            frame._pending = None
         
-        # Add scrollbar
-        scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=tree.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        tree.configure(yscrollcommand=scrollbar.set)
+        rows = self.category_rows.get(current)
+        if rows is None:
+            return
+        
+        self.param_tree.delete(*self.param_tree.get_children())
+        for param_name, values in rows:
+            self.param_tree.insert('', 'end', text=param_name, values=values)
+        
+        self.param_scrollbar.pack(in_=frame, side=tk.RIGHT, fill=tk.Y)
+        self.param_tree.pack(in_=frame, fill=tk.BOTH, expand=True, padx=5, pady=5)
+        # Tabs are created after the tree, so raise it above the tab frame
+        self.param_scrollbar.lift()
+        self.param_tree.lift()
     
     def _create_uncategorized_tab(self, params: list, param_details: dict):
         """Create tab for uncategorized parameters"""
@@ -142,16 +186,15 @@ class ParameterInspector(ttk.Frame):
         # Create text widget
         text = tk.Text(frame, wrap=tk.WORD)
         text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        text.tag_config('header', font=self.header_font)
         
-        text.insert(tk.END, "UNCATEGORIZED PARAMETERS\n", 'header')
-        text.insert(tk.END, "These parameters need manual categorization:\n\n")
-        
+        lines = ["These parameters need manual categorization:\n\n"]
         for param in params:
             param_info = param_details.get(param, {})
-            text.insert(tk.END, f"• {param}\n")
-            text.insert(tk.END, f"  Type: {param_info.get('type', 'unknown')}\n")
+            lines.append(f"• {param}\n")
+            lines.append(f"  Type: {param_info.get('type', 'unknown')}\n")
             if param_info.get('range'):
-                text.insert(tk.END, f"  Range: {param_info['range']}\n")
-            text.insert(tk.END, "\n")
+                lines.append(f"  Range: {param_info['range']}\n")
+            lines.append("\n")
         
-        text.tag_config('header', font=('Arial', 12, 'bold'))
\ No newline at end of file
+        text.insert(tk.END, "UNCATEGORIZED PARAMETERS\n", 'header', "".join(lines), ())
\ No newline at end of file
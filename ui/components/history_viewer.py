@@ -8,6 +8,10 @@ import json
 import os
 from pathlib import Path
 from datetime import datetime
+import re
+
+# <plugin>_enhanced_<YYYYmmdd>_<HHMMSS>, split once without strptime
+_FNAME_RE = re.compile(r'^(.+)_enhanced_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})$')
 
 class HistoryViewer(tk.Toplevel):
     """Window for viewing complete analysis history"""
@@ -24,6 +28,9 @@ class HistoryViewer(tk.Toplevel):
         self.discoveries_dir = self.data_dir / "discoveries"
         self.learned_patterns_path = self.data_dir / "learned_patterns.json"
         
+        # Plugin whose details are currently shown
+        self._last_selected = None
+        
         # Create UI
         self._create_ui()
         
@@ -143,6 +150,7 @@ class HistoryViewer(tk.Toplevel):
         """Load all plugin analysis history"""
         self.plugin_listbox.delete(0, tk.END)
         self.plugin_data = {}
+        self._last_selected = None
         
         # Load discovery files
         if self.discoveries_dir.exists():
@@ -155,39 +163,36 @@ class HistoryViewer(tk.Toplevel):
                     
                     # Extract plugin name and timestamp from filename
                     filename = file_path.stem
-                    parts = filename.rsplit('_enhanced_', 1)
-                    if len(parts) == 2:
+                    m = _FNAME_RE.match(filename)
+                    if m:
+                        plugin_name = m.group(1)
+                        display_time = f"{m[2]}-{m[3]}-{m[4]} {m[5]}:{m[6]}:{m[7]}"
+                    else:
+                        parts = filename.rsplit('_enhanced_', 1)
                         plugin_name = parts[0]
-                        timestamp_str = parts[1]
-                        
-                        # Parse timestamp
-                        try:
-                            timestamp = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                            display_time = timestamp.strftime("%Y-%m-%d %H:%M:%S")
-                        except:
-                            display_time = timestamp_str
-                        
-                        # Create display string
-                        params = data.get('parameters', {})
-                        # Handle case where parameters might not be a dict
-                        if isinstance(params, dict):
-                            param_count = len([k for k in params.keys() if not k.startswith('_')])
-                        else:
-                            param_count = 0
-                            
-                        display_str = f"{plugin_name} ({display_time}) - {param_count} params"
-                        
-                        # Add to listbox
-                        self.plugin_listbox.insert(tk.END, display_str)
-                        
-                        # Store data
-                        self.plugin_data[display_str] = {
-                            'name': plugin_name,
-                            'timestamp': display_time,
-                            'file_path': str(file_path),
-                            'data': data
-                        }
+                        display_time = parts[1] if len(parts) == 2 else 'unknown'
+                    
+                    # Create display string
+                    params = data.get('parameters', {})
+                    # Handle case where parameters might not be a dict
+                    if isinstance(params, dict):
+                        param_count = len([k for k in params.keys() if not k.startswith('_')])
+                    else:
+                        param_count = 0
                         
+                    display_str = f"{plugin_name} ({display_time}) - {param_count} params"
+                    
+                    # Add to listbox
+                    self.plugin_listbox.insert(tk.END, display_str)
+                    
+                    # Store data
+                    self.plugin_data[display_str] = {
+                        'name': plugin_name,
+                        'timestamp': display_time,
+                        'file_path': str(file_path),
+                        'data': data
+                    }
+                    
                 except Exception as e:
                     print(f"Error loading {file_path}: {e}")
         
@@ -237,6 +242,11 @@ class HistoryViewer(tk.Toplevel):
         display_str = self.plugin_listbox.get(selection[0])
         if display_str not in self.plugin_data:
             return
+        
+        # Focus changes and repeated clicks re-fire the event for the same row
+        if display_str == self._last_selected:
+            return
+        self._last_selected = display_str
             
         plugin_info = self.plugin_data[display_str]
         plugin_data = plugin_info['data']
@@ -380,8 +390,11 @@ class HistoryViewer(tk.Toplevel):
         if result:
             try:
                 # Delete discovery files
-                for file_path in self.discoveries_dir.glob("*_enhanced_*.json"):
-                    file_path.unlink()
+                with os.scandir(self.discoveries_dir) as it:
+                    for entry in it:
+                        if (entry.is_file() and '_enhanced_' in entry.name
+                                and entry.name.endswith('.json')):
+                            os.unlink(entry.path)
                     
                 # Reload
                 self.load_history()
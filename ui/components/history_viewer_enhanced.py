@@ -3,13 +3,127 @@ Enhanced History viewer component for displaying all analyzed plugins and their
 """
 
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
+from tkinter import ttk, scrolledtext, messagebox, filedialog
 import json
 import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
 from pathlib import Path
 from datetime import datetime
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import re
 
+from core import json_compat
+from core.history_index import (count_parameters, count_public_params, format_mtime,
+                                load_index, make_entry, save_index)
+
+# <plugin>_enhanced_<YYYYmmdd>_<HHMMSS>, split once without strptime
+_FNAME_RE = re.compile(r'^(.+)_enhanced_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})$')
+
+# Hidden/temp files and the exporter's learning reports share the
+# discoveries directory but are never discovery files
+_SKIP_PREFIXES = ('.', '~', 'learning_report_')
+
+# Trailing commas before a closing bracket, a common hand-edit JSON error
+_TRAILING_COMMA_RE = re.compile(rb',\s*([}\]])')
+
+# Number of pretty-printed raw JSON views kept for quick reselection
+RAW_CACHE_SIZE = 8
+
+# Characters of raw JSON inserted up front and per scroll-to-bottom
+RAW_CHUNK_SIZE = 64 * 1024
+
+# Raw JSON beyond this many characters is left to Export Selected
+RAW_MAX_SIZE = 2_000_000
+
+# Worker threads used to read and parse discovery files
+LOAD_WORKERS = 8
+
+# Files parsed per batch handed from the background loader to the Tk thread
+LOAD_BATCH_SIZE = 64
+
+# How often the Tk thread picks up parsed batches, in ms
+LOAD_POLL_MS = 50
+
+# Fixed row height of the virtualized plugin list, in pixels
+LIST_ROW_HEIGHT = 20
+
+# How often a running report script is checked for completion, in ms
+REPORT_POLL_MS = 200
+
+
+def _read_discovery_file(file_path):
+    """Read and parse a discovery file, normalizing nested parameters"""
+    with open(file_path, 'rb') as f:
+        content = f.read()
+    
+    # Try to parse JSON
+    try:
+        data = json_compat.loads(content)
+    except json.JSONDecodeError as je:
+        # Try to fix common JSON errors
+        fixed_content = _TRAILING_COMMA_RE.sub(rb'\1', content)
+        try:
+            data = json_compat.loads(fixed_content)
+        except:
+            # If still fails, create error entry
+            raise je
+    
+    # Valid JSON that isn't an object can't be a discovery; report it as an error row
+    if not isinstance(data, dict):
+        raise ValueError(f"Expected a JSON object, got {type(data).__name__}")
+    
+    # Handle nested structure if present
+    if 'discovery' in data and 'parameters' in data['discovery']:
+        data['parameters'] = data['discovery']['parameters']  # Normalize structure
+    
+    return data
+
+
+def _as_export_record(info):
+    """The fields of a history entry written by Export All"""
+    return {
+        'timestamp': info['timestamp'],
+        'source': info['source'],
+        'file_path': info['file_path'],
+        'data': info['data']
+    }
+
+
+def _as_plugin_info(info):
+    """A history entry as written by Export Selected, without internal fields"""
+    return {
+        'name': info['name'],
+        'timestamp': info['timestamp'],
+        'file_path': info['file_path'],
+        'data': info['data'],
+        'source': info['source']
+    }
+
+
+def _load_one(file_path):
+    """Worker-thread wrapper returning (data, error) for a discovery file"""
+    try:
+        return _read_discovery_file(file_path), None
+    except Exception as e:
+        return None, e
+
+
+def _load_in_batches(paths, out_queue, cancel):
+    """Parse files in batches on a pool, queueing [(path, (data, error))] then None"""
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+        for start in range(0, len(paths), LOAD_BATCH_SIZE):
+            if cancel.is_set():
+                return
+            batch = paths[start:start + LOAD_BATCH_SIZE]
+            out_queue.put(list(zip(batch, executor.map(_load_one, batch))))
+    out_queue.put(None)
+
+
 class HistoryViewer(tk.Toplevel):
     """Window for viewing complete analysis history"""
     
@@ -25,6 +139,51 @@ class HistoryViewer(tk.Toplevel):
         self.discoveries_dir = self.data_dir / "discoveries"
         self.learned_patterns_path = self.data_dir / "learned_patterns.json"
         
+        # (mtime, parsed) of learned_patterns.json from the last stats update
+        self._patterns_cache = None
+        
+        # Filtered rows of the plugin list, first row in view, selected row
+        self._all_rows = []
+        self._list_offset = 0
+        self._selected_row = None
+        
+        # Lowercased rows for search, and the pending debounced search
+        self._search_index = []
+        self._search_after = None
+        
+        # Details tabs already rendered for the selected plugin
+        self.plugin_data = {}
+        self._current_display = None
+        self._rendered_tabs = {}
+        
+        # Parsed discovery files by path: ((mtime_ns, size), data)
+        self._file_cache = {}
+        # Newest discovery file mtime seen by the last scan
+        self._newest_file_mtime = 0.0
+        
+        # Background parse of discovery files: its result queue, stop flag
+        # and next poll
+        self._load_queue = None
+        self._load_cancel = None
+        self._load_after = None
+        self._pending_files = {}
+        
+        # Index entries rebuilt by the current load, and whether to save them
+        self._pending_index = {}
+        self._index_changed = False
+        
+        # Running report script, the file collecting its stderr, its next poll
+        self._report_proc = None
+        self._report_stderr = None
+        self._report_after = None
+        
+        # Pretty-printed raw JSON for recently viewed plugins, most recent last
+        self._raw_cache = OrderedDict()
+        # Raw JSON not yet inserted into the Raw Data tab
+        self._raw_pending = None
+        self._raw_offset = 0
+        self._raw_more_pending = False
+        
         # Create UI
         self._create_ui()
         
@@ -69,17 +228,31 @@ class HistoryViewer(tk.Toplevel):
         list_frame = ttk.Frame(left_frame)
         list_frame.pack(fill=tk.BOTH, expand=True)
         
-        scrollbar = ttk.Scrollbar(list_frame)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # The list is virtualized: the tree only holds the rows currently in
+        # view and the scrollbar is driven from self._all_rows
+        self.list_scrollbar = ttk.Scrollbar(list_frame, command=self._on_list_scroll)
+        self.list_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.plugin_listbox = tk.Listbox(list_frame, 
-                                         yscrollcommand=scrollbar.set,
-                                         font=('Helvetica', 10))
-        self.plugin_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        scrollbar.config(command=self.plugin_listbox.yview)
+        ttk.Style(self).configure('History.Treeview', rowheight=LIST_ROW_HEIGHT)
+        self.plugin_list = ttk.Treeview(list_frame, show='tree', selectmode='browse',
+                                        style='History.Treeview')
+        self.plugin_list.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Bind selection event
-        self.plugin_listbox.bind('<<ListboxSelect>>', self._on_plugin_selected)
+        # Bind selection, resize and wheel events
+        self.plugin_list.bind('<<TreeviewSelect>>', self._on_plugin_selected)
+        self.plugin_list.bind('<Configure>', lambda e: self._refresh_visible_rows())
+        self.plugin_list.bind('<MouseWheel>', self._on_list_wheel)
+        self.plugin_list.bind('<Button-4>', self._on_list_wheel)
+        self.plugin_list.bind('<Button-5>', self._on_list_wheel)
+        
+        # The tree only holds the rows in view, so keyboard movement is
+        # handled against the full row list
+        self.plugin_list.bind('<Up>', lambda e: self._move_selection(-1))
+        self.plugin_list.bind('<Down>', lambda e: self._move_selection(1))
+        self.plugin_list.bind('<Prior>', lambda e: self._move_selection(-self._visible_row_count()))
+        self.plugin_list.bind('<Next>', lambda e: self._move_selection(self._visible_row_count()))
+        self.plugin_list.bind('<Home>', lambda e: self._move_selection(-len(self._all_rows)))
+        self.plugin_list.bind('<End>', lambda e: self._move_selection(len(self._all_rows)))
         
         # Stats frame
         stats_frame = ttk.LabelFrame(left_frame, text="Statistics")
@@ -101,29 +274,17 @@ class HistoryViewer(tk.Toplevel):
         self.details_notebook = ttk.Notebook(right_frame)
         self.details_notebook.pack(fill=tk.BOTH, expand=True)
         
-        # Overview tab
-        overview_frame = ttk.Frame(self.details_notebook)
-        self.details_notebook.add(overview_frame, text="Overview")
-        self.overview_text = scrolledtext.ScrolledText(overview_frame, wrap=tk.WORD)
-        self.overview_text.pack(fill=tk.BOTH, expand=True)
-        
-        # Parameters tab
-        params_frame = ttk.Frame(self.details_notebook)
-        self.details_notebook.add(params_frame, text="Parameters")
-        self.params_text = scrolledtext.ScrolledText(params_frame, wrap=tk.WORD)
-        self.params_text.pack(fill=tk.BOTH, expand=True)
-        
-        # Categories tab
-        categories_frame = ttk.Frame(self.details_notebook)
-        self.details_notebook.add(categories_frame, text="Categories")
-        self.categories_text = scrolledtext.ScrolledText(categories_frame, wrap=tk.WORD)
-        self.categories_text.pack(fill=tk.BOTH, expand=True)
-        
-        # Raw Data tab
-        raw_frame = ttk.Frame(self.details_notebook)
-        self.details_notebook.add(raw_frame, text="Raw Data")
-        self.raw_text = scrolledtext.ScrolledText(raw_frame, wrap=tk.WORD, font=('Courier', 9))
-        self.raw_text.pack(fill=tk.BOTH, expand=True)
+        # Tabs start as empty frames; each text widget is built the first
+        # time its tab is shown
+        self._tab_frames = []
+        for title in ("Overview", "Parameters", "Categories", "Raw Data"):
+            frame = ttk.Frame(self.details_notebook)
+            self.details_notebook.add(frame, text=title)
+            self._tab_frames.append(frame)
+        self._tab_builders = (self._build_overview_tab, self._build_params_tab,
+                              self._build_categories_tab, self._build_raw_tab)
+        self._built_tabs = set()
+        self.details_notebook.bind('<<NotebookTabChanged>>', self._render_current_tab)
         
         # Bottom buttons
         button_frame = ttk.Frame(main_frame)
@@ -140,280 +301,689 @@ class HistoryViewer(tk.Toplevel):
         ttk.Button(button_frame, text="Close", 
                   command=self.destroy).pack(side=tk.RIGHT)
         
+    def _build_overview_tab(self, frame):
+        """Create the Overview text widget"""
+        self.overview_text = scrolledtext.ScrolledText(frame, wrap=tk.WORD)
+        self.overview_text.pack(fill=tk.BOTH, expand=True)
+        
+    def _build_params_tab(self, frame):
+        """Create the Parameters text widget"""
+        self.params_text = scrolledtext.ScrolledText(frame, wrap=tk.WORD)
+        self.params_text.pack(fill=tk.BOTH, expand=True)
+        
+    def _build_categories_tab(self, frame):
+        """Create the Categories text widget"""
+        self.categories_text = scrolledtext.ScrolledText(frame, wrap=tk.WORD)
+        self.categories_text.pack(fill=tk.BOTH, expand=True)
+        
+    def _build_raw_tab(self, frame):
+        """Create the read-only Raw Data text widget"""
+        self.raw_text = scrolledtext.ScrolledText(frame, wrap=tk.WORD, font=('Courier', 9),
+                                                  state=tk.DISABLED)
+        self.raw_text.pack(fill=tk.BOTH, expand=True)
+        # Watch scrolling so more of a large document is appended near the end
+        self.raw_text.configure(yscrollcommand=self._on_raw_scroll)
+        
     def load_history(self):
         """Load all plugin analysis history including errors"""
-        self.plugin_listbox.delete(0, tk.END)
+        self._cancel_background_load()
         self.plugin_data = {}
         self.failed_files = []
+        self._raw_cache.clear()
+        self._current_display = None
+        self._rendered_tabs.clear()
+        
+        # Session rows come first, then one slot per discovery file in
+        # mtime order; slots fill in as their files are parsed
+        self._session_rows = []
+        self._file_rows = []
         
         # First, add current session discoveries from app instance if available
         if self.app_instance and hasattr(self.app_instance, 'all_discoveries'):
             for plugin_name, discovery_data in self.app_instance.all_discoveries.items():
                 display_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                params = discovery_data.get('parameters', {})
-                if isinstance(params, dict):
-                    param_count = len([k for k in params.keys() if not k.startswith('_')])
-                else:
-                    param_count = 0
-                    
+                param_count = count_public_params(discovery_data.get('parameters', {}))
                 display_str = f"{plugin_name} (Current Session) - {param_count} params"
                 
-                self.plugin_listbox.insert(tk.END, display_str)
+                self._session_rows.append(display_str)
                 self.plugin_data[display_str] = {
                     'name': plugin_name,
                     'timestamp': display_time,
                     'file_path': 'In Memory',
                     'data': discovery_data,
-                    'source': 'session'
+                    'source': 'session',
+                    'param_count': param_count
                 }
         
         # Load ALL files from disk
         if self.discoveries_dir.exists():
-            # Get ALL JSON files
-            all_files = list(self.discoveries_dir.glob("*.json"))
+            # Rows for files whose index entry is current come straight from
+            # the index; their JSON is only parsed when selected
+            index = load_index(self.discoveries_dir)
             
-            for file_path in sorted(all_files, key=lambda x: x.stat().st_mtime, reverse=True):
-                filename = file_path.stem
-                
-                # Try to extract plugin name
-                if '_enhanced_' in filename:
-                    parts = filename.rsplit('_enhanced_', 1)
-                    plugin_name = parts[0]
-                    timestamp_str = parts[1] if len(parts) == 2 else 'unknown'
-                else:
-                    plugin_name = filename
-                    timestamp_str = 'unknown'
-                
-                # Get file modification time
-                file_time = datetime.fromtimestamp(file_path.stat().st_mtime)
-                display_time = file_time.strftime("%Y-%m-%d %H:%M:%S")
-                
-                # Try to load the file
-                try:
-                    with open(file_path, 'r') as f:
-                        content = f.read()
-                    
-                    # Try to parse JSON
-                    try:
-                        data = json.loads(content)
-                    except json.JSONDecodeError as je:
-                        # Try to fix common JSON errors
-                        fixed_content = re.sub(r',\s*([}\]])', r'\\1', content)
-                        try:
-                            data = json.loads(fixed_content)
-                        except:
-                            # If still fails, create error entry
-                            raise je
-                    
-                    # Count parameters
-                    params = data.get('parameters', {})
-                    if isinstance(params, dict):
-                        param_count = len([k for k in params.keys() if not k.startswith('_')])
-                    else:
-                        param_count = 0
-                    
-                    # Handle nested structure if present
-                    if 'discovery' in data and 'parameters' in data['discovery']:
-                        params = data['discovery']['parameters']
-                        param_count = len([k for k in params.keys() if not k.startswith('_')])
-                        data['parameters'] = params  # Normalize structure
-                    
-                    display_str = f"{plugin_name} ({display_time}) - {param_count} params"
-                    
-                    # Add to listbox
-                    self.plugin_listbox.insert(tk.END, display_str)
-                    
-                    # Store data
-                    self.plugin_data[display_str] = {
-                        'name': plugin_name,
-                        'timestamp': display_time,
-                        'file_path': str(file_path),
-                        'data': data,
-                        'source': 'file'
-                    }
-                    
-                except Exception as e:
-                    # Add failed file info
-                    self.failed_files.append({
-                        'path': str(file_path),
-                        'name': plugin_name,
-                        'error': str(e),
-                        'time': display_time
-                    })
-                    
-                    # Still add to list but mark as error
-                    display_str = f"{plugin_name} ({display_time}) - [ERROR: {type(e).__name__}]"
-                    
-                    self.plugin_listbox.insert(tk.END, display_str)
+            # Get ALL JSON files; DirEntry.stat() avoids a second syscall per file
+            all_files = []
+            with os.scandir(self.discoveries_dir) as it:
+                for dir_entry in it:
+                    name = dir_entry.name
+                    # Filter on the name before touching the file itself
+                    if not name.endswith('.json') or name.startswith(_SKIP_PREFIXES):
+                        continue
+                    if dir_entry.is_file():
+                        st = dir_entry.stat()
+                        all_files.append((name, dir_entry.path, st.st_mtime,
+                                          (st.st_mtime_ns, st.st_size)))
+            
+            all_files.sort(key=lambda x: x[2], reverse=True)
+            self._newest_file_mtime = all_files[0][2] if all_files else 0.0
+            
+            # Files that are neither indexed nor cached must be parsed
+            to_parse = []
+            for name, file_path, mtime, stat_key in all_files:
+                entry = index.get(name)
+                cached = self._file_cache.get(file_path)
+                if not (entry and entry.get('mtime') == mtime) and not (cached and cached[0] == stat_key):
+                    to_parse.append(file_path)
+            
+            # The newest batch is parsed now so the first rows appear with
+            # the list; the rest is parsed in the background
+            first_batch = to_parse[:LOAD_BATCH_SIZE]
+            if len(first_batch) > 1:
+                with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+                    parsed = dict(zip(first_batch, executor.map(_load_one, first_batch)))
+            else:
+                parsed = {path: _load_one(path) for path in first_batch}
+            
+            background = set(to_parse[LOAD_BATCH_SIZE:])
+            self._pending_index = index
+            self._index_changed = False
+            self._pending_files = {}
+            for name, file_path, mtime, stat_key in all_files:
+                entry = index.get(name)
+                if entry and entry.get('mtime') == mtime:
+                    # Reuse data parsed on an earlier pass if the file is unchanged
+                    cached = self._file_cache.get(file_path)
+                    display_str = f"{entry['name']} ({entry['timestamp']}) - {entry['param_count']} params"
+                    self._file_rows.append(display_str)
                     self.plugin_data[display_str] = {
-                        'name': plugin_name,
-                        'timestamp': display_time,
-                        'file_path': str(file_path),
-                        'data': {'error': str(e), 'error_type': type(e).__name__},
-                        'source': 'error'
+                        'name': entry['name'],
+                        'timestamp': entry['timestamp'],
+                        'file_path': file_path,
+                        'data': cached[1] if cached and cached[0] == stat_key else None,
+                        'source': 'file',
+                        'param_count': entry['param_count'],
+                        'stat_key': stat_key
                     }
+                elif file_path in background:
+                    self._pending_files[file_path] = (len(self._file_rows), name, mtime, stat_key)
+                    self._file_rows.append(None)
+                else:
+                    # Parsed just now, or unchanged since an earlier pass
+                    result = parsed.get(file_path) or (self._file_cache[file_path][1], None)
+                    self._file_rows.append(self._add_file_row(name, file_path, mtime, stat_key,
+                                                              result))
+            
+            # Forget parsed data for files that are gone
+            live_paths = {f[1] for f in all_files}
+            for path in list(self._file_cache):
+                if path not in live_paths:
+                    del self._file_cache[path]
+            
+            # Drop entries for deleted files
+            seen = {f[0] for f in all_files}
+            for name in set(index) - seen:
+                del index[name]
+                self._index_changed = True
+            
+            if self._pending_files:
+                self._start_background_load(list(self._pending_files))
+            else:
+                self._save_pending_index()
+        
+        # Show the new rows, then let Tk redraw once
+        self._show_loaded_rows(keep_offset=False)
         
         # Update statistics
         self.update_stats()
+        self.update_idletasks()
+        
+    def _add_file_row(self, name, file_path, mtime, stat_key, result):
+        """Record a parsed (data, error) result for a discovery file and return its row"""
+        filename = name[:-len('.json')]
+        
+        # Try to extract plugin name, preferring the filename timestamp
+        m = _FNAME_RE.match(filename)
+        if m:
+            plugin_name = m.group(1)
+            display_time = f"{m[2]}-{m[3]}-{m[4]} {m[5]}:{m[6]}:{m[7]}"
+        else:
+            plugin_name = filename.rsplit('_enhanced_', 1)[0]
+            # Fall back to file modification time
+            display_time = format_mtime(mtime)
+        
+        data, error = result
+        if error is None:
+            self._file_cache[file_path] = (stat_key, data)
+            param_count = count_parameters(data)
+            
+            display_str = f"{plugin_name} ({display_time}) - {param_count} params"
+            self.plugin_data[display_str] = {
+                'name': plugin_name,
+                'timestamp': display_time,
+                'file_path': file_path,
+                'data': data,
+                'source': 'file',
+                'param_count': param_count,
+                'stat_key': stat_key
+            }
+            
+            self._pending_index[name] = make_entry(Path(file_path), plugin_name, param_count,
+                                                   timestamp=display_time, mtime=mtime)
+            self._index_changed = True
+        else:
+            # Add failed file info
+            self.failed_files.append({
+                'path': file_path,
+                'name': plugin_name,
+                'error': str(error),
+                'time': display_time
+            })
+            
+            # Still add to list but mark as error
+            display_str = f"{plugin_name} ({display_time}) - [ERROR: {type(error).__name__}]"
+            self.plugin_data[display_str] = {
+                'name': plugin_name,
+                'timestamp': display_time,
+                'file_path': file_path,
+                'data': {'error': str(error), 'error_type': type(error).__name__},
+                'source': 'error'
+            }
+        return display_str
+        
+    def _show_loaded_rows(self, keep_offset=True):
+        """Push the rows loaded so far to the plugin list, honouring the search"""
+        display_strs = self._session_rows + [row for row in self._file_rows if row is not None]
+        self._search_index = [(s.lower(), s) for s in display_strs]
+        if self.search_var.get():
+            self._apply_search(keep_offset=keep_offset)
+        else:
+            self._set_list_rows(display_strs, keep_offset=keep_offset)
+        
+    def _start_background_load(self, paths):
+        """Parse the remaining discovery files off the Tk thread"""
+        self._load_queue = queue.Queue()
+        self._load_cancel = threading.Event()
+        threading.Thread(target=_load_in_batches,
+                         args=(paths, self._load_queue, self._load_cancel),
+                         daemon=True).start()
+        self._load_after = self.after(LOAD_POLL_MS, self._drain_load_queue, self._load_queue)
+        
+    def _cancel_background_load(self):
+        """Stop a background load left over from an earlier refresh"""
+        if self._load_cancel is not None:
+            self._load_cancel.set()
+        if self._load_after is not None:
+            self.after_cancel(self._load_after)
+        self._load_queue = None
+        self._load_cancel = None
+        self._load_after = None
+        
+    def _add_pending_rows(self, results):
+        """Fill the row slots of background-loaded files from (path, (data, error)) pairs"""
+        for file_path, result in results:
+            slot, name, mtime, stat_key = self._pending_files.pop(file_path)
+            self._file_rows[slot] = self._add_file_row(name, file_path, mtime, stat_key, result)
+        
+    def _drain_load_queue(self, load_queue):
+        """Add rows for batches parsed in the background since the last poll"""
+        self._load_after = None
+        if load_queue is not self._load_queue:
+            return
+        
+        finished = False
+        added = False
+        while True:
+            try:
+                batch = load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:
+                finished = True
+                break
+            self._add_pending_rows(batch)
+            added = True
+        
+        if added:
+            self._show_loaded_rows()
+            self.update_stats()
+        if finished:
+            self._load_queue = None
+            self._load_cancel = None
+            self._save_pending_index()
+        else:
+            self._load_after = self.after(LOAD_POLL_MS, self._drain_load_queue, load_queue)
+            
+    def _finish_background_load(self):
+        """Parse the files the background load has not reached yet, here and now"""
+        load_queue = self._load_queue
+        if load_queue is None:
+            return
+        self._cancel_background_load()
+        
+        # Keep the batches already queued; any the loader adds after the cancel are ignored
+        results = {}
+        while True:
+            try:
+                batch = load_queue.get_nowait()
+            except queue.Empty:
+                break
+            if batch is None:
+                break
+            results.update(batch)
+        
+        remaining = [path for path in self._pending_files if path not in results]
+        if remaining:
+            with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+                results.update(zip(remaining, executor.map(_load_one, remaining)))
+        
+        self._add_pending_rows(results.items())
+        self._show_loaded_rows()
+        self.update_stats()
+        self._save_pending_index()
+        
+    def destroy(self):
+        """Stop background work and pending callbacks before the window goes"""
+        self._cancel_background_load()
+        # Entries parsed so far are still worth keeping
+        self._save_pending_index()
+        
+        for after_id in (self._search_after, self._report_after):
+            if after_id is not None:
+                self.after_cancel(after_id)
+        self._search_after = None
+        self._report_after = None
+        # The report script runs on by itself; only its stderr file is ours
+        self._finish_report()
+        super().destroy()
+            
+    def _save_pending_index(self):
+        """Persist index entries rebuilt by the last load"""
+        if not self._index_changed:
+            return
+        try:
+            save_index(self.discoveries_dir, self._pending_index)
+        except Exception as e:
+            print(f"Error saving history index: {e}")
+        self._index_changed = False
         
     def update_stats(self):
         """Update statistics display"""
         total_analyses = len(self.plugin_data)
-        unique_plugins = len(set(p['name'] for p in self.plugin_data.values()))
-        
-        # Count by source
-        session_count = len([p for p in self.plugin_data.values() if p.get('source') == 'session'])
-        file_count = len([p for p in self.plugin_data.values() if p.get('source') == 'file'])
-        error_count = len([p for p in self.plugin_data.values() if p.get('source') == 'error'])
         
-        # Count total parameters discovered
+        # Count plugins, sources and parameters in one pass
+        names = set()
+        sources = Counter()
         total_params = 0
         for p in self.plugin_data.values():
-            if p.get('source') != 'error' and 'parameters' in p['data']:
-                params = p['data']['parameters']
-                if isinstance(params, dict):
-                    total_params += len([k for k in params.keys() if not k.startswith('_')])
+            names.add(p['name'])
+            source = p.get('source')
+            sources[source] += 1
+            if source != 'error':
+                total_params += p.get('param_count', 0)
         
-        stats_text = f"Total Analyses: {total_analyses}\\n"
-        stats_text += f"Unique Plugins: {unique_plugins}\\n"
-        stats_text += f"Total Parameters: {total_params}\\n\\n"
-        stats_text += f"Current Session: {session_count}\\n"
-        stats_text += f"From Files: {file_count}\\n"
+        unique_plugins = len(names)
+        session_count = sources['session']
+        file_count = sources['file']
+        error_count = sources['error']
+        
+        stats_text = f"Total Analyses: {total_analyses}\n"
+        stats_text += f"Unique Plugins: {unique_plugins}\n"
+        stats_text += f"Total Parameters: {total_params}\n\n"
+        stats_text += f"Current Session: {session_count}\n"
+        stats_text += f"From Files: {file_count}\n"
         
         if error_count > 0:
-            stats_text += f"Failed to Load: {error_count}\\n"
+            stats_text += f"Failed to Load: {error_count}\n"
         
         # Add learning stats if available
         try:
             if self.learned_patterns_path.exists():
-                with open(self.learned_patterns_path, 'r') as f:
-                    patterns = json.load(f)
+                # Only re-read the file when it has changed on disk
+                st = self.learned_patterns_path.stat()
+                if self._patterns_cache and self._patterns_cache[0] == st.st_mtime:
+                    patterns = self._patterns_cache[1]
+                else:
+                    with open(self.learned_patterns_path, 'rb') as f:
+                        patterns = json_compat.loads(f.read())
+                    self._patterns_cache = (st.st_mtime, patterns)
                 
                 if 'plugin_history' in patterns:
-                    stats_text += f"\\nLearning History: {len(patterns['plugin_history'])}"
+                    stats_text += f"\nLearning History: {len(patterns['plugin_history'])}"
                 if 'parameter_patterns' in patterns:
-                    stats_text += f"\\nLearned Patterns: {len(patterns['parameter_patterns'])}"
+                    stats_text += f"\nLearned Patterns: {len(patterns['parameter_patterns'])}"
         except:
             pass
         
         self.stats_label.config(text=stats_text)
         
+    def _load_cached(self, file_path, stat_key):
+        """Parse a discovery file unless it is cached with the same mtime and size"""
+        cached = self._file_cache.get(file_path)
+        if cached and cached[0] == stat_key:
+            return cached[1]
+        data = _read_discovery_file(file_path)
+        self._file_cache[file_path] = (stat_key, data)
+        return data
+        
+    def _ensure_data(self, plugin_info, cache=True):
+        """Parse an index-listed file the first time its data is needed"""
+        if plugin_info['data'] is None:
+            try:
+                if cache:
+                    plugin_info['data'] = self._load_cached(plugin_info['file_path'],
+                                                            plugin_info['stat_key'])
+                else:
+                    plugin_info['data'] = _read_discovery_file(plugin_info['file_path'])
+            except Exception as e:
+                plugin_info['data'] = {'error': str(e), 'error_type': type(e).__name__}
+                plugin_info['source'] = 'error'
+        return plugin_info['data']
+        
+    def _set_list_rows(self, rows, keep_offset=False):
+        """Replace the rows behind the plugin list, scrolling to the top unless kept"""
+        self._all_rows = rows
+        if keep_offset:
+            self._list_offset = max(0, min(self._list_offset, len(rows) - self._visible_row_count()))
+        else:
+            self._list_offset = 0
+        self._refresh_visible_rows()
+        
+    def _visible_row_count(self):
+        """Number of rows that fit in the plugin list"""
+        height = self.plugin_list.winfo_height()
+        if height <= 1:
+            # Not mapped yet; fill a reasonable first screen
+            return 50
+        return max(1, height // LIST_ROW_HEIGHT)
+        
+    def _refresh_visible_rows(self):
+        """Materialize only the rows in view and update the scrollbar"""
+        tree = self.plugin_list
+        total = len(self._all_rows)
+        visible = self._visible_row_count()
+        offset = max(0, min(self._list_offset, total - visible))
+        self._list_offset = offset
+        
+        tree.delete(*tree.get_children())
+        for i, row in enumerate(self._all_rows[offset:offset + visible], start=offset):
+            tree.insert('', 'end', iid=str(i), text=row)
+            if row == self._selected_row:
+                tree.selection_set(str(i))
+        
+        if total:
+            self.list_scrollbar.set(offset / total, min(1.0, (offset + visible) / total))
+        else:
+            self.list_scrollbar.set(0.0, 1.0)
+            
+    def _on_list_scroll(self, action, *args):
+        """Scrollbar callback for the virtualized plugin list"""
+        visible = self._visible_row_count()
+        if action == 'moveto':
+            self._list_offset = int(float(args[0]) * len(self._all_rows))
+        elif action == 'scroll':
+            step = int(args[0])
+            if args[1] == 'pages':
+                step *= visible
+            self._list_offset += step
+        self._refresh_visible_rows()
+        
+    def _on_list_wheel(self, event):
+        """Scroll the plugin list with the mouse wheel"""
+        if event.num == 4 or getattr(event, 'delta', 0) > 0:
+            self._list_offset -= 3
+        else:
+            self._list_offset += 3
+        self._refresh_visible_rows()
+        return 'break'
+        
+    def _move_selection(self, step):
+        """Move the selection by step rows, scrolling the list to keep it in view"""
+        total = len(self._all_rows)
+        if not total:
+            return 'break'
+        
+        selection = self.plugin_list.selection()
+        if selection:
+            current = int(selection[0])
+        elif self._selected_row in self._all_rows:
+            current = self._all_rows.index(self._selected_row)
+        else:
+            # Nothing selected yet; start from the first row in view
+            current = self._list_offset - 1 if step > 0 else self._list_offset
+        target = max(0, min(total - 1, current + step))
+        
+        visible = self._visible_row_count()
+        if target < self._list_offset:
+            self._list_offset = target
+        elif target >= self._list_offset + visible:
+            self._list_offset = target - visible + 1
+        
+        # Re-rendering selects the row, which fires <<TreeviewSelect>>
+        self._selected_row = self._all_rows[target]
+        self._refresh_visible_rows()
+        self.plugin_list.focus(str(target))
+        self.plugin_list.see(str(target))
+        return 'break'
+        
+    def _selected_display(self):
+        """Display string of the selected plugin list row, if any"""
+        selection = self.plugin_list.selection()
+        if not selection:
+            return None
+        return self._all_rows[int(selection[0])]
+        
     def _on_search_changed(self, *args):
-        """Handle search text changes"""
-        search_text = self.search_var.get().lower()
+        """Handle search text changes, waiting for typing to pause"""
+        if self._search_after:
+            self.after_cancel(self._search_after)
+        self._search_after = self.after(150, self._apply_search)
         
-        # Clear and repopulate listbox
-        self.plugin_listbox.delete(0, tk.END)
+    def _apply_search(self, keep_offset=False):
+        """Filter the plugin list by the current search text"""
+        # Called directly while a debounced search is pending, that one is moot
+        if self._search_after:
+            self.after_cancel(self._search_after)
+        self._search_after = None
+        search_text = self.search_var.get().lower()
         
-        for display_str, data in self.plugin_data.items():
-            if search_text in display_str.lower():
-                self.plugin_listbox.insert(tk.END, display_str)
+        # Filter the rows behind the plugin list
+        rows = [display_str for lowered, display_str in self._search_index
+                if search_text in lowered]
+        self._set_list_rows(rows, keep_offset=keep_offset)
                 
     def _on_plugin_selected(self, event):
         """Handle plugin selection"""
-        selection = self.plugin_listbox.curselection()
-        if not selection:
-            return
-            
         # Get selected plugin
-        display_str = self.plugin_listbox.get(selection[0])
+        display_str = self._selected_display()
         if display_str not in self.plugin_data:
             return
+        self._selected_row = display_str
+        
+        # Scrolling re-selects the row when it comes back into view
+        if display_str == self._current_display:
+            return
             
         plugin_info = self.plugin_data[display_str]
-        plugin_data = plugin_info['data']
+        self._ensure_data(plugin_info)
         
         # Update header
         self.details_header.config(text=f"{plugin_info['name']} - {plugin_info['timestamp']}")
         
-        # Update overview
+        # Only the visible tab is rendered now; others render when shown
+        self._current_display = display_str
+        self._render_current_tab()
+        
+    def _render_current_tab(self, event=None):
+        """Render the selected details tab if it is stale for the current plugin"""
+        tab_idx = self.details_notebook.index('current')
+        if tab_idx not in self._built_tabs:
+            self._tab_builders[tab_idx](self._tab_frames[tab_idx])
+            self._built_tabs.add(tab_idx)
+        
+        plugin_info = self.plugin_data.get(self._current_display)
+        if plugin_info is None:
+            return
+        
+        # Each tab remembers which plugin it last showed, so flipping back
+        # to a plugin only redraws the tabs viewed for another one since
+        if self._rendered_tabs.get(tab_idx) == self._current_display:
+            return
+        
+        renderers = (self._render_overview, self._render_parameters,
+                     self._render_categories, self._render_raw)
+        renderers[tab_idx](self._current_display, plugin_info, plugin_info['data'])
+        self._rendered_tabs[tab_idx] = self._current_display
+        
+    def _render_overview(self, display_str, plugin_info, plugin_data):
+        """Fill the Overview tab"""
         self.overview_text.delete(1.0, tk.END)
-        overview = f"Plugin: {plugin_info['name']}\\n"
-        overview += f"Analysis Date: {plugin_info['timestamp']}\\n"
-        overview += f"File: {plugin_info['file_path']}\\n"
-        overview += f"Source: {plugin_info['source']}\\n\\n"
+        overview_buf = [
+            f"Plugin: {plugin_info['name']}\n",
+            f"Analysis Date: {plugin_info['timestamp']}\n",
+            f"File: {plugin_info['file_path']}\n",
+            f"Source: {plugin_info['source']}\n\n"
+        ]
         
         if plugin_info['source'] == 'error':
-            overview += f"ERROR: {plugin_data.get('error', 'Unknown error')}\\n"
-            overview += f"Error Type: {plugin_data.get('error_type', 'Unknown')}\\n"
+            overview_buf.append(f"ERROR: {plugin_data.get('error', 'Unknown error')}\n")
+            overview_buf.append(f"Error Type: {plugin_data.get('error_type', 'Unknown')}\n")
         else:
             if 'metadata' in plugin_data:
                 meta = plugin_data['metadata']
-                overview += "METADATA:\\n"
+                overview_buf.append("METADATA:\n")
                 for key, value in meta.items():
-                    overview += f"  {key}: {value}\\n"
-                overview += "\\n"
+                    overview_buf.append(f"  {key}: {value}\n")
+                overview_buf.append("\n")
                 
             if 'learning_annotations' in plugin_data:
                 annotations = plugin_data['learning_annotations']
-                overview += "LEARNING INSIGHTS:\\n"
-                overview += f"  Effect Type: {annotations.get('effect_type', 'Unknown')}\\n"
-                overview += f"  Confidence: {annotations.get('confidence', 0):.2%}\\n"
+                overview_buf.append("LEARNING INSIGHTS:\n")
+                overview_buf.append(f"  Effect Type: {annotations.get('effect_type', 'Unknown')}\n")
+                overview_buf.append(f"  Confidence: {annotations.get('confidence', 0):.2%}\n")
                 
                 if 'applied_patterns' in annotations:
-                    overview += f"  Applied Patterns: {len(annotations['applied_patterns'])}\\n"
+                    overview_buf.append(f"  Applied Patterns: {len(annotations['applied_patterns'])}\n")
                     
-        self.overview_text.insert(1.0, overview)
+        self.overview_text.insert(1.0, "".join(overview_buf))
         
-        # Update parameters
+    def _render_parameters(self, display_str, plugin_info, plugin_data):
+        """Fill the Parameters tab"""
         self.params_text.delete(1.0, tk.END)
         if plugin_info['source'] != 'error' and 'parameters' in plugin_data:
-            params_text = "DISCOVERED PARAMETERS:\\n\\n"
+            params_buf = ["DISCOVERED PARAMETERS:\n\n"]
             params = plugin_data['parameters']
             
             if isinstance(params, dict):
                 sorted_params = sorted(params.items())
                 for param_name, param_info in sorted_params:
                     if not param_name.startswith('_') and isinstance(param_info, dict):
-                        params_text += f"{param_name}:\\n"
+                        params_buf.append(f"{param_name}:\n")
                         for key, value in param_info.items():
-                            params_text += f"  {key}: {value}\\n"
-                        params_text += "\\n"
+                            params_buf.append(f"  {key}: {value}\n")
+                        params_buf.append("\n")
             else:
-                params_text += "Invalid parameter format\\n"
+                params_buf.append("Invalid parameter format\n")
                     
-            self.params_text.insert(1.0, params_text)
-            
-        # Update categories
+            self.params_text.insert(1.0, "".join(params_buf))
+        
+    def _render_categories(self, display_str, plugin_info, plugin_data):
+        """Fill the Categories tab"""
         self.categories_text.delete(1.0, tk.END)
         if 'categorized' in plugin_data:
             categories = plugin_data['categorized']
-            cat_text = "PARAMETER CATEGORIES:\\n\\n"
+            cat_buf = ["PARAMETER CATEGORIES:\n\n"]
             
             if isinstance(categories, dict) and 'categories' in categories:
                 for cat_name, cat_info in categories['categories'].items():
-                    cat_text += f"{cat_name.upper()}:\\n"
+                    cat_buf.append(f"{cat_name.upper()}:\n")
                     if 'description' in cat_info:
-                        cat_text += f"  {cat_info['description']}\\n"
+                        cat_buf.append(f"  {cat_info['description']}\n")
                     if 'parameters' in cat_info:
-                        cat_text += f"  Parameters: {', '.join(cat_info['parameters'])}\\n"
-                    cat_text += "\\n"
+                        cat_buf.append(f"  Parameters: {', '.join(cat_info['parameters'])}\n")
+                    cat_buf.append("\n")
                     
             if 'uncategorized' in categories and categories['uncategorized']:
-                cat_text += f"UNCATEGORIZED:\\n"
-                cat_text += f"  {', '.join(categories['uncategorized'])}\\n"
+                cat_buf.append("UNCATEGORIZED:\n")
+                cat_buf.append(f"  {', '.join(categories['uncategorized'])}\n")
                 
-            self.categories_text.insert(1.0, cat_text)
-            
-        # Update raw data
-        self.raw_text.delete(1.0, tk.END)
+            self.categories_text.insert(1.0, "".join(cat_buf))
+        
+    def _render_raw(self, display_str, plugin_info, plugin_data):
+        """Fill the Raw Data tab"""
         if plugin_info['source'] == 'error':
-            self.raw_text.insert(1.0, f"File: {plugin_info['file_path']}\\n\\nError loading file:\\n{plugin_data.get('error', 'Unknown error')}")
+            text = f"File: {plugin_info['file_path']}\n\nError loading file:\n{plugin_data.get('error', 'Unknown error')}"
         else:
-            self.raw_text.insert(1.0, json.dumps(plugin_data, indent=2))
+            text = self._get_raw_json(display_str, plugin_data)
+            if len(text) > RAW_MAX_SIZE:
+                text = (text[:RAW_MAX_SIZE] +
+                        f"\n\n... [truncated, {len(text) - RAW_MAX_SIZE:,} more characters; "
+                        "use Export Selected for the full JSON]")
+        
+        # Insert only the first chunk; the rest follows as the user scrolls
+        self._raw_pending = text
+        self._raw_offset = 0
+        self.raw_text.config(state=tk.NORMAL)
+        self.raw_text.delete(1.0, tk.END)
+        self.raw_text.config(state=tk.DISABLED)
+        self._append_raw_chunk()
+        
+    def _on_raw_scroll(self, first, last):
+        """Update the raw scrollbar and queue more text when near the end"""
+        self.raw_text.vbar.set(first, last)
+        if self._raw_pending and float(last) > 0.9 and not self._raw_more_pending:
+            self._raw_more_pending = True
+            self.after_idle(self._append_raw_chunk)
+            
+    def _append_raw_chunk(self):
+        """Append the next chunk of pending raw JSON"""
+        self._raw_more_pending = False
+        if not self._raw_pending:
+            return
+        
+        # Slice by offset so the unsent tail is never copied
+        end = self._raw_offset + RAW_CHUNK_SIZE
+        chunk = self._raw_pending[self._raw_offset:end]
+        if end < len(self._raw_pending):
+            self._raw_offset = end
+        else:
+            self._raw_pending = None
+        self.raw_text.config(state=tk.NORMAL)
+        self.raw_text.insert(tk.END, chunk)
+        self.raw_text.config(state=tk.DISABLED)
+        
+    def _get_raw_json(self, display_str, plugin_data):
+        """Return pretty-printed JSON for a plugin, reusing recent results"""
+        text = self._raw_cache.get(display_str)
+        if text is None:
+            text = json_compat.dumps(plugin_data, indent=True).decode('utf-8')
+            self._raw_cache[display_str] = text
+            if len(self._raw_cache) > RAW_CACHE_SIZE:
+                self._raw_cache.popitem(last=False)
+        else:
+            self._raw_cache.move_to_end(display_str)
+        return text
         
     def export_selected(self):
         """Export selected plugin data"""
-        selection = self.plugin_listbox.curselection()
-        if not selection:
+        display_str = self._selected_row
+        if display_str not in self.plugin_data:
             messagebox.showwarning("No Selection", "Please select a plugin to export")
             return
             
-        display_str = self.plugin_listbox.get(selection[0])
         plugin_info = self.plugin_data[display_str]
+        self._ensure_data(plugin_info)
         
         # Ask for save location
-        from tkinter import filedialog
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
@@ -424,17 +994,19 @@ class HistoryViewer(tk.Toplevel):
             try:
                 export_data = {
                     'export_date': datetime.now().isoformat(),
-                    'plugin_info': plugin_info
+                    'plugin_info': _as_plugin_info(plugin_info)
                 }
-                with open(filename, 'w') as f:
-                    json.dump(export_data, f, indent=2)
+                with open(filename, 'wb') as f:
+                    f.write(json_compat.dumps(export_data, indent=True))
                 messagebox.showinfo("Export Complete", f"Exported to {filename}")
             except Exception as e:
                 messagebox.showerror("Export Error", str(e))
                 
     def export_all(self):
         """Export all history data"""
-        from tkinter import filedialog
+        # Files still loading in the background belong in the export
+        self._finish_background_load()
+        
         filename = filedialog.asksaveasfilename(
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")],
@@ -443,52 +1015,115 @@ class HistoryViewer(tk.Toplevel):
         
         if filename:
             try:
-                export_data = {
-                    'export_date': datetime.now().isoformat(),
-                    'total_analyses': len(self.plugin_data),
-                    'failed_files': self.failed_files,
-                    'plugins': {}
-                }
-                
-                # Organize by plugin name
-                for display_str, info in self.plugin_data.items():
-                    plugin_name = info['name']
-                    if plugin_name not in export_data['plugins']:
-                        export_data['plugins'][plugin_name] = []
-                    
-                    export_data['plugins'][plugin_name].append({
-                        'timestamp': info['timestamp'],
-                        'source': info['source'],
-                        'file_path': info['file_path'],
-                        'data': info['data']
-                    })
-                
-                with open(filename, 'w') as f:
-                    json.dump(export_data, f, indent=2)
+                with open(filename, 'wb') as f:
+                    self._write_history_export(f)
                     
                 messagebox.showinfo("Export Complete", 
                                   f"Exported {len(self.plugin_data)} analyses to {filename}")
             except Exception as e:
                 messagebox.showerror("Export Error", str(e))
                 
+    def _write_history_export(self, f):
+        """Stream the full history export to a binary file one record at a time"""
+        # Organize by plugin name (references only, no copies)
+        plugins = defaultdict(list)
+        for info in self.plugin_data.values():
+            plugins[info['name']].append(info)
+        
+        dumps = json_compat.dumps
+        f.write(b'{\n')
+        f.write(b'  "export_date": ' + dumps(datetime.now().isoformat()) + b',\n')
+        f.write(b'  "total_analyses": ' + dumps(len(self.plugin_data)) + b',\n')
+        f.write(b'  "failed_files": ' + dumps(self.failed_files) + b',\n')
+        f.write(b'  "plugins": {')
+        
+        for i, (plugin_name, infos) in enumerate(plugins.items()):
+            f.write(b',' if i else b'')
+            f.write(b'\n    ' + dumps(plugin_name) + b': [')
+            for j, info in enumerate(infos):
+                # Files listed from the index are parsed just for this record
+                was_loaded = info['data'] is not None
+                self._ensure_data(info, cache=False)
+                
+                f.write(b',' if j else b'')
+                f.write(b'\n      ')
+                f.write(dumps(_as_export_record(info)))
+                
+                if not was_loaded and info['source'] == 'file':
+                    info['data'] = None
+            f.write(b'\n    ]')
+        
+        f.write(b'\n  }\n}\n')
+        
     def generate_report(self):
         """Generate comprehensive analysis report"""
+        report_path = self.data_dir / "comprehensive_analysis_report.md"
+        if self._report_is_current(report_path):
+            messagebox.showinfo("Report Up To Date",
+                              f"No discoveries have changed since the last report:\n{report_path}")
+            return
+        
+        # A report is already being generated
+        if self._report_proc is not None:
+            return
+        
+        # Parse files still loading in the background so the history is complete
+        self._finish_background_load()
+        
+        # Run the script in the background and poll it so Tk keeps running
         try:
-            import subprocess
             script_path = Path(__file__).parent.parent.parent / "generate_full_analysis_report.py"
             
-            result = subprocess.run(
-                ['/opt/anaconda3/bin/python', str(script_path)],
-                capture_output=True,
-                text=True
+            # stderr goes to a file so a chatty script can't fill a pipe
+            # that is only read once it exits
+            self._report_stderr = tempfile.TemporaryFile()
+            self._report_proc = subprocess.Popen(
+                [sys.executable, str(script_path)],
+                stdout=subprocess.DEVNULL,
+                stderr=self._report_stderr
             )
-            
-            if result.returncode == 0:
-                report_path = self.data_dir / "comprehensive_analysis_report.md"
-                messagebox.showinfo("Report Generated", 
-                                  f"Comprehensive report generated:\\n{report_path}")
-            else:
-                messagebox.showerror("Report Error", result.stderr)
-                
         except Exception as e:
-            messagebox.showerror("Report Error", str(e))
\ No newline at end of file
+            self._finish_report()
+            messagebox.showerror("Report Error", str(e))
+            return
+            
+        self._report_after = self.after(REPORT_POLL_MS, self._poll_report, report_path)
+        
+    def _poll_report(self, report_path):
+        """Check on the report script and report its result once it exits"""
+        self._report_after = None
+        returncode = self._report_proc.poll()
+        if returncode is None:
+            self._report_after = self.after(REPORT_POLL_MS, self._poll_report, report_path)
+            return
+            
+        self._report_stderr.seek(0)
+        stderr = self._report_stderr.read().decode('utf-8', errors='replace')
+        self._finish_report()
+        
+        if returncode == 0:
+            messagebox.showinfo("Report Generated", 
+                              f"Comprehensive report generated:\n{report_path}")
+        else:
+            messagebox.showerror("Report Error", stderr)
+            
+    def _finish_report(self):
+        """Forget the report process and close its stderr file"""
+        if self._report_stderr is not None:
+            self._report_stderr.close()
+        self._report_proc = None
+        self._report_stderr = None
+            
+    def _report_is_current(self, report_path):
+        """Whether the report is newer than every input the report script reads"""
+        try:
+            report_mtime = report_path.stat().st_mtime
+            # The directory mtime catches files added or removed since the scan
+            newest_input = max(self._newest_file_mtime,
+                               self.discoveries_dir.stat().st_mtime)
+        except OSError:
+            return False
+        
+        if self.learned_patterns_path.exists():
+            newest_input = max(newest_input, self.learned_patterns_path.stat().st_mtime)
+        return report_mtime > newest_input
@@ -3,15 +3,101 @@ Dashboard to show learning progress and patterns
 """
 import tkinter as tk
 from tkinter import ttk
-import json
+import tkinter.font as tkfont
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
+
+from core import json_compat
+
+# Quiet period after update_dashboard before reloading from disk, in ms
+RELOAD_DELAY_MS = 250
+
+# How often to check for a finished background load, in ms
+LOAD_POLL_MS = 50
+
+# Data files shown by the dashboard, relative to the working directory
+PATTERNS_FILE = Path('data/learned_patterns.json')
+REPORT_FILE = Path('data/discoveries/learning_report_latest.json')
+
+# Pattern tree sections: (node text, patterns key, type description, child type)
+PATTERN_CATEGORIES = (
+    ('String Formats', 'string_formats', 'Format Patterns', 'string'),
+    ('Parameter Patterns', 'parameter_patterns', 'Recognition Patterns', 'regex'),
+    ('Effect Types', 'effect_signatures', 'Plugin Classifications', 'effect'),
+)
+
+# Parsed JSON files by path: ((mtime_ns, size), data)
+_JSON_CACHE: Dict[str, tuple] = {}
+
+
+def _stat_key(path: Path) -> Optional[tuple]:
+    """(mtime_ns, size) of a file, or None if it does not exist"""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _files_changed() -> bool:
+    """Whether either data file differs from what was last parsed"""
+    for path in (PATTERNS_FILE, REPORT_FILE):
+        key = _stat_key(path)
+        cached = _JSON_CACHE.get(str(path))
+        if key != (cached[0] if cached else None):
+            return True
+    return False
+
+
+def _load_json_cached(path: Path) -> Optional[Dict]:
+    """Parse a JSON file, reusing the last result while its mtime and size are unchanged"""
+    key = _stat_key(path)
+    if key is None:
+        _JSON_CACHE.pop(str(path), None)
+        return None
+    
+    cached = _JSON_CACHE.get(str(path))
+    if cached and cached[0] == key:
+        return cached[1]
+    
+    with open(path, 'rb') as f:
+        data = json_compat.loads(f.read())
+    _JSON_CACHE[str(path)] = (key, data)
+    return data
+
+
+def _read_learning_files() -> Tuple[Optional[Dict], Optional[Dict]]:
+    """Read the learned patterns and latest report; runs on the I/O thread"""
+    patterns = None
+    try:
+        patterns = _load_json_cached(PATTERNS_FILE)
+    except Exception as e:
+        print(f"Error loading patterns: {e}")
+    
+    # Load latest report if available
+    report = None
+    try:
+        report = _load_json_cached(REPORT_FILE)
+    except Exception as e:
+        print(f"Error loading report: {e}")
+    
+    return patterns, report
+
 
 class LearningDashboard(ttk.Frame):
     """Display learning progress and discovered patterns"""
     
     def __init__(self, parent):
         super().__init__(parent)
+        # Files are read on this thread; results are applied on the Tk thread
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+        self._load_future = None
+        # Last loaded data, kept to fill tabs that are built later
+        self._patterns = None
+        self._report = None
+        # Pending debounced reload after update_dashboard
+        self._reload_pending = None
         self.create_widgets()
         self.load_learning_data()
     
@@ -30,20 +116,34 @@ class LearningDashboard(ttk.Frame):
         self.notebook = ttk.Notebook(main_frame)
         self.notebook.pack(fill='both', expand=True)
         
-        # Statistics tab
+        # Statistics tab, shown first so it is built right away
         self.stats_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.stats_frame, text="Statistics")
         self._create_stats_view()
         
-        # Patterns tab
+        # Patterns and insights tabs are built the first time they are shown
         self.patterns_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.patterns_frame, text="Learned Patterns")
-        self._create_patterns_view()
         
-        # Insights tab
         self.insights_frame = ttk.Frame(self.notebook)
         self.notebook.add(self.insights_frame, text="Insights")
-        self._create_insights_view()
+        
+        self._built = {'stats'}
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+    
+    def _on_tab_changed(self, event=None):
+        """Build a tab on first view and fill it from the last loaded data"""
+        tab = str(self.notebook.select())
+        if tab == str(self.patterns_frame) and 'patterns' not in self._built:
+            self._create_patterns_view()
+            self._built.add('patterns')
+            if self._patterns is not None:
+                self._fill_pattern_tree(self._patterns)
+        elif tab == str(self.insights_frame) and 'insights' not in self._built:
+            self._create_insights_view()
+            self._built.add('insights')
+            if self._report is not None:
+                self._fill_insights(self._report)
     
     def _create_stats_view(self):
         """Create statistics view"""
@@ -55,7 +155,6 @@ class LearningDashboard(ttk.Frame):
         overall_frame = ttk.LabelFrame(stats_container, text="Overall Progress", padding="10")
         overall_frame.pack(fill='x', pady=(0, 10))
         
-        self.stats_labels = {}
         stats_items = [
             ('plugins_analyzed', 'Plugins Analyzed:'),
             ('total_parameters', 'Total Parameters:'),
@@ -64,9 +163,14 @@ class LearningDashboard(ttk.Frame):
             ('validation_rate', 'Validation Success Rate:')
         ]
         
+        # One named font shared by every value label
+        self.value_font = tkfont.Font(family='Arial', size=10, weight='bold')
+        self.stats_labels = {key: ttk.Label(overall_frame, text="0", font=self.value_font)
+                             for key, _ in stats_items}
+        
+        # Place everything once all labels exist
         for i, (key, label) in enumerate(stats_items):
             ttk.Label(overall_frame, text=label).grid(row=i, column=0, sticky='w', padx=(0, 10))
-            self.stats_labels[key] = ttk.Label(overall_frame, text="0", font=('Arial', 10, 'bold'))
             self.stats_labels[key].grid(row=i, column=1, sticky='w')
         
         # Recent discoveries frame
@@ -114,14 +218,20 @@ class LearningDashboard(ttk.Frame):
         
         patterns_container.grid_rowconfigure(0, weight=1)
         patterns_container.grid_columnconfigure(0, weight=1)
+        
+        # Pattern kinds are filled in only while their node is open
+        self._pattern_nodes = {}
+        self.pattern_tree.bind('<<TreeviewOpen>>', self._on_pattern_open)
+        self.pattern_tree.bind('<<TreeviewClose>>', self._on_pattern_close)
     
     def _create_insights_view(self):
         """Create insights view"""
         insights_container = ttk.Frame(self.insights_frame, padding="10")
         insights_container.pack(fill='both', expand=True)
         
-        # Insights text
+        # Insights text; (heading, body) of each insight shown, in order
         self.insights_text = tk.Text(insights_container, height=20, width=70, wrap='word')
+        self._insight_blocks = []
         self.insights_text.pack(fill='both', expand=True)
         
         # Scrollbar
@@ -135,72 +245,106 @@ class LearningDashboard(ttk.Frame):
         self.insights_text.tag_configure('highlight', foreground='blue')
     
     def load_learning_data(self):
-        """Load and display learning data"""
-        patterns_file = Path('data/learned_patterns.json')
-        
-        if patterns_file.exists():
+        """Load and display learning data without blocking the UI thread"""
+        future = self._io_pool.submit(_read_learning_files)
+        self._load_future = future
+        # Tk may only be called from this thread, so poll for the result here
+        # rather than scheduling from the worker
+        self.after(LOAD_POLL_MS, self._poll_load, future)
+    
+    def _poll_load(self, future):
+        """Apply a finished load, or check again shortly"""
+        if future is not self._load_future:
+            return
+        if not future.done():
+            self.after(LOAD_POLL_MS, self._poll_load, future)
+            return
+        self._apply_data(future)
+    
+    def _apply_data(self, future):
+        """Update the widgets from a finished load"""
+        patterns, report = future.result()
+        
+        # The JSON cache hands back the same object while a file's mtime and
+        # size are unchanged, so an unchanged file needs no redraw
+        if patterns is not None and patterns is not self._patterns:
+            self._patterns = patterns
             try:
-                with open(patterns_file, 'r') as f:
-                    data = json.load(f)
-                    self._update_from_patterns(data)
+                self._update_from_patterns(patterns)
             except Exception as e:
                 print(f"Error loading patterns: {e}")
         
-        # Load latest report if available
-        report_file = Path('data/discoveries/learning_report_latest.json')
-        if report_file.exists():
+        if report is not None and report is not self._report:
+            self._report = report
             try:
-                with open(report_file, 'r') as f:
-                    report = json.load(f)
-                    self._update_from_report(report)
+                self._update_from_report(report)
             except Exception as e:
                 print(f"Error loading report: {e}")
     
     def _update_from_patterns(self, patterns: Dict):
         """Update display from patterns data"""
+        # Look each section up once
+        plugin_history = patterns.get('plugin_history')
+        string_formats = patterns.get('string_formats')
+        effect_signatures = patterns.get('effect_signatures')
+        
         # Update stats
-        if 'plugin_history' in patterns:
-            self.stats_labels['plugins_analyzed'].config(text=str(len(patterns['plugin_history'])))
-        
-        if 'string_formats' in patterns:
-            self.stats_labels['patterns_learned'].config(
-                text=str(len(patterns['string_formats']) + 
-                        len(patterns.get('parameter_patterns', {})) +
-                        len(patterns.get('range_patterns', {})))
-            )
+        if plugin_history is not None:
+            self.stats_labels['plugins_analyzed'].config(text=str(len(plugin_history)))
+        
+        if string_formats is not None:
+            total_learned = (len(string_formats) +
+                             len(patterns.get('parameter_patterns') or {}) +
+                             len(patterns.get('range_patterns') or {}))
+            self.stats_labels['patterns_learned'].config(text=str(total_learned))
         
-        if 'effect_signatures' in patterns:
-            self.stats_labels['effect_types'].config(text=str(len(patterns['effect_signatures'])))
-        
-        # Update pattern tree
-        self.pattern_tree.delete(*self.pattern_tree.get_children())
-        
-        # Add string formats
-        if patterns.get('string_formats'):
-            formats_node = self.pattern_tree.insert('', 'end', text='String Formats', 
-                                                   values=('Format Patterns', 
-                                                          len(patterns['string_formats']), ''))
-            for param, fmt in list(patterns['string_formats'].items())[:5]:
-                self.pattern_tree.insert(formats_node, 'end', text=param,
-                                       values=('string', 1, fmt))
-        
-        # Add parameter patterns
-        if patterns.get('parameter_patterns'):
-            param_node = self.pattern_tree.insert('', 'end', text='Parameter Patterns',
-                                                values=('Recognition Patterns',
-                                                       len(patterns['parameter_patterns']), ''))
-            for pattern, category in list(patterns['parameter_patterns'].items())[:5]:
-                self.pattern_tree.insert(param_node, 'end', text=pattern,
-                                       values=('regex', 1, category))
-        
-        # Add effect signatures
-        if patterns.get('effect_signatures'):
-            effect_node = self.pattern_tree.insert('', 'end', text='Effect Types',
-                                                 values=('Plugin Classifications',
-                                                        len(patterns['effect_signatures']), ''))
-            for plugin, effect in list(patterns['effect_signatures'].items())[:5]:
-                self.pattern_tree.insert(effect_node, 'end', text=plugin,
-                                       values=('effect', 1, effect))
+        if effect_signatures is not None:
+            self.stats_labels['effect_types'].config(text=str(len(effect_signatures)))
+        
+        if 'patterns' in self._built:
+            self._fill_pattern_tree(patterns)
+    
+    def _fill_pattern_tree(self, patterns: Dict):
+        """Show one collapsed node per pattern kind; children are added when opened"""
+        # Take the tree out of the layout while it is rebuilt so it is
+        # redrawn once rather than after every insert
+        self.pattern_tree.grid_remove()
+        try:
+            self.pattern_tree.delete(*self.pattern_tree.get_children())
+            self._pattern_nodes = {}
+            
+            for title, key, description, kind in PATTERN_CATEGORIES:
+                entries = patterns.get(key)
+                if entries:
+                    node = self.pattern_tree.insert('', 'end', text=title,
+                                                    values=(description, len(entries), ''))
+                    self._add_pattern_placeholder(node, key, kind)
+        finally:
+            self.pattern_tree.grid()
+    
+    def _add_pattern_placeholder(self, node: str, key: str, kind: str):
+        """Give a pattern node a dummy child so it shows an expand arrow"""
+        self._pattern_nodes[node] = (key, kind)
+        self.pattern_tree.insert(node, 'end', text='…')
+    
+    def _on_pattern_open(self, event=None):
+        """Insert every pattern of the opened kind"""
+        node = self.pattern_tree.focus()
+        if node not in self._pattern_nodes or self._patterns is None:
+            return
+        key, kind = self._pattern_nodes[node]
+        
+        self.pattern_tree.delete(*self.pattern_tree.get_children(node))
+        for name, value in self._patterns.get(key, {}).items():
+            self.pattern_tree.insert(node, 'end', text=name, values=(kind, 1, value))
+    
+    def _on_pattern_close(self, event=None):
+        """Drop the children of a closed pattern node to bound the tree size"""
+        node = self.pattern_tree.focus()
+        if node not in self._pattern_nodes:
+            return
+        self.pattern_tree.delete(*self.pattern_tree.get_children(node))
+        self.pattern_tree.insert(node, 'end', text='…')
     
     def _update_from_report(self, report: Dict):
         """Update display from learning report"""
@@ -214,18 +358,40 @@ class LearningDashboard(ttk.Frame):
                 text=f"{stats.get('validation_success_rate', 0):.1f}%"
             )
         
-        # Update insights
-        self.insights_text.delete(1.0, tk.END)
-        
-        if 'learning_insights' in report:
-            for insight in report['learning_insights']:
-                self.insights_text.insert(tk.END, f"{insight['title']}\n", 'heading')
-                
-                if isinstance(insight['data'], dict):
-                    for key, value in insight['data'].items():
-                        self.insights_text.insert(tk.END, f"  • {key}: {value}\n")
-                
-                self.insights_text.insert(tk.END, "\n")
+        if 'insights' in self._built:
+            self._fill_insights(report)
+    
+    def _fill_insights(self, report: Dict):
+        """Write the report's learning insights, redrawing only the insights that changed"""
+        blocks = []
+        for insight in report.get('learning_insights', []):
+            body = []
+            if isinstance(insight['data'], dict):
+                for key, value in insight['data'].items():
+                    body.append(f"  • {key}: {value}\n")
+            body.append("\n")
+            blocks.append((f"{insight['title']}\n", "".join(body)))
+        
+        old_blocks = self._insight_blocks
+        if len(blocks) != len(old_blocks):
+            # Structure changed; rewrite everything and mark each block start
+            self.insights_text.delete(1.0, tk.END)
+            for i, (heading, body) in enumerate(blocks):
+                self.insights_text.mark_set(f'insight_{i}', 'end-1c')
+                self.insights_text.mark_gravity(f'insight_{i}', 'left')
+                self.insights_text.insert(tk.END, heading, 'heading', body, ())
+        else:
+            for i, block in enumerate(blocks):
+                if block == old_blocks[i]:
+                    continue
+                # Insert the new text after the block start, then delete the
+                # old text up to the next block
+                end = f'insight_{i + 1}' if i + 1 < len(blocks) else 'end-1c'
+                self.insights_text.mark_set('insight_edit', f'insight_{i}')
+                self.insights_text.mark_gravity('insight_edit', 'right')
+                self.insights_text.insert(f'insight_{i}', block[0], 'heading', block[1], ())
+                self.insights_text.delete('insight_edit', end)
+        self._insight_blocks = blocks
     
     def update_dashboard(self, learning_data: Dict):
         """Update dashboard with new learning data"""
@@ -252,13 +418,22 @@ class LearningDashboard(ttk.Frame):
             
             self.recent_text.insert(1.0, discovery_text)
             
-            # Limit text size
-            lines = self.recent_text.get(1.0, tk.END).split('\n')
-            if len(lines) > 100:
+            # Limit text size; the line count comes from the end index
+            # rather than copying the whole buffer out
+            last_line = int(self.recent_text.index('end-1c').split('.')[0])
+            if last_line >= 100:
                 self.recent_text.delete('100.0', tk.END)
         
-        # Reload full data
-        self.load_learning_data()
+        # Reload full data once a burst of updates has settled
+        if self._reload_pending:
+            self.after_cancel(self._reload_pending)
+        self._reload_pending = self.after(RELOAD_DELAY_MS, self._do_reload)
+    
+    def _do_reload(self):
+        """Reload after update_dashboard, but only if the data files changed"""
+        self._reload_pending = None
+        if _files_changed():
+            self.load_learning_data()
     
     def refresh(self):
         """Refresh the dashboard display"""
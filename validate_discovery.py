@@ -3,9 +3,9 @@
 Validation script - compares research expectations vs actual discoveries
 """
 
-from core import UniversalPluginDiscovery, ResearchValidator
+from core import UniversalPluginDiscovery, ResearchValidator, json_compat
 from pathlib import Path
-import json
+import sys
 
 def compare_vintageverb():
     """Compare research data vs actual discovery for VintageVerb"""
@@ -14,8 +14,8 @@ def compare_vintageverb():
     print("="*60)
     
     # Load research data
-    with open('data/research_data.json', 'r') as f:
-        research = json.load(f)
+    with open('data/research_data.json', 'rb') as f:
+        research = json_compat.loads(f.read())
     
     vintageverb_research = research.get('vintageverb', {})
     
@@ -23,33 +23,37 @@ def compare_vintageverb():
     discovery = UniversalPluginDiscovery("/Library/Audio/Plug-Ins/VST3/ValhallaVintageVerb.vst3")
     discovered = discovery.discover_all()
     
+    # Collect the report and write it in one go
+    out = []
+    
     # Compare each research parameter
-    print("\nParameter Validation:")
-    print("-"*50)
+    out.append("\nParameter Validation:")
+    out.append("-"*50)
     
     matches = 0
     mismatches = []
     
+    # Discovered parameters by lowercased name, keeping the first on collisions
+    discovered_by_lower = {}
+    for disc_name, disc_info in discovered.items():
+        discovered_by_lower.setdefault(disc_name.lower(), disc_info)
+    
     for param_name, expected in vintageverb_research.items():
-        print(f"\n{param_name}:")
-        print(f"  Expected type: {expected.get('type')}")
+        out.append(f"\n{param_name}:")
+        out.append(f"  Expected type: {expected.get('type')}")
         
         # Find in discovered (case-insensitive)
-        discovered_param = None
-        for disc_name, disc_info in discovered.items():
-            if disc_name.lower() == param_name.lower():
-                discovered_param = disc_info
-                break
+        discovered_param = discovered_by_lower.get(param_name.lower())
         
         if discovered_param:
-            print(f"  Discovered type: {discovered_param.get('type')}")
+            out.append(f"  Discovered type: {discovered_param.get('type')}")
             
             # Check type match
             if expected.get('type') == discovered_param.get('type'):
-                print("  ✅ Type matches!")
+                out.append("  ✅ Type matches!")
                 matches += 1
             else:
-                print("  ❌ Type mismatch!")
+                out.append("  ❌ Type mismatch!")
                 mismatches.append(f"{param_name}: expected {expected.get('type')} but got {discovered_param.get('type')}")
             
             # Check range if numeric
@@ -57,45 +61,47 @@ def compare_vintageverb():
                 exp_range = expected['range']
                 disc_range = discovered_param['range']
                 if exp_range == disc_range[:2]:  # Compare min/max only
-                    print("  ✅ Range matches!")
+                    out.append("  ✅ Range matches!")
                 else:
-                    print(f"  ⚠️  Range difference: expected {exp_range} got {disc_range[:2]}")
+                    out.append(f"  ⚠️  Range difference: expected {exp_range} got {disc_range[:2]}")
             
             # Check valid values for lists
             if expected.get('valid_values') and discovered_param.get('valid_values'):
                 exp_values = set(expected['valid_values'])
                 disc_values = set(discovered_param['valid_values'])
                 if exp_values == disc_values:
-                    print("  ✅ Valid values match!")
+                    out.append("  ✅ Valid values match!")
                 else:
-                    print(f"  ❌ Valid values differ!")
-                    print(f"     Expected: {expected['valid_values']}")
-                    print(f"     Got: {discovered_param['valid_values'][:5]}...")
+                    out.append(f"  ❌ Valid values differ!")
+                    out.append(f"     Expected: {expected['valid_values']}")
+                    out.append(f"     Got: {discovered_param['valid_values'][:5]}...")
                     
         else:
-            print("  ❌ Parameter not found in discovery!")
+            out.append("  ❌ Parameter not found in discovery!")
             mismatches.append(f"{param_name}: not found")
     
     # Summary
-    print("\n" + "="*50)
-    print(f"VALIDATION SUMMARY:")
-    print(f"  Matches: {matches}/{len(vintageverb_research)}")
-    print(f"  Success rate: {matches/len(vintageverb_research)*100:.1f}%")
+    out.append("\n" + "="*50)
+    out.append(f"VALIDATION SUMMARY:")
+    out.append(f"  Matches: {matches}/{len(vintageverb_research)}")
+    out.append(f"  Success rate: {matches/len(vintageverb_research)*100:.1f}%")
     
     if mismatches:
-        print(f"\nMismatches found:")
+        out.append(f"\nMismatches found:")
         for mismatch in mismatches:
-            print(f"  - {mismatch}")
+            out.append(f"  - {mismatch}")
     
     # Show discovered params not in research
     research_params = {p.lower() for p in vintageverb_research.keys()}
-    discovered_params = {p.lower() for p in discovered.keys() if not p.startswith('_')}
+    discovered_params = {p for p in discovered_by_lower if not p.startswith('_')}
     extra_params = discovered_params - research_params
     
     if extra_params:
-        print(f"\nExtra parameters discovered (not in research):")
+        out.append(f"\nExtra parameters discovered (not in research):")
         for param in sorted(extra_params):
-            print(f"  - {param}")
+            out.append(f"  - {param}")
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 def main():
     compare_vintageverb()
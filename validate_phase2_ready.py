@@ -5,78 +5,155 @@ Checks if a plugin discovery is ready for Phase 2
 """
 import json
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-def validate_discovery(filepath):
-    """Validate a single discovery file for Phase 2 readiness"""
-    try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
-            
-        plugin_name = data.get('plugin', 'Unknown')
-        print(f"\n🔍 Validating: {plugin_name}")
-        
-        discovery = data.get('discovery', data)
-        parameters = discovery.get('parameters', {})
+# Kept standalone rather than importing core, which pulls in plugin hosting
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _loads(data):
+    """Parse JSON bytes, with the same stdlib fallback as core.json_compat"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects the NaN/Infinity literals json.dump writes
+            pass
+    return json.loads(data)
+
+# Optional: stream parameters instead of loading whole files
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def _stream_parameters(filepath):
+    """Yield (name, info) for each parameter without loading the whole file.
+    
+    Raises LookupError when discovery.parameters has no entries, so flat
+    files and empty discoveries are left to the whole-file load.
+    """
+    with open(filepath, 'rb') as f:
+        found = False
+        for item in ijson.kvitems(f, 'discovery.parameters'):
+            found = True
+            yield item
+    if not found:
+        raise LookupError("no discovery.parameters to stream")
+
+
+def _load_parameters(filepath):
+    """Return the plugin name and an iterator of (name, info) parameter pairs"""
+    with open(filepath, 'rb') as f:
+        data = _loads(f.read())
+    discovery = data.get('discovery', data)
+    return data.get('plugin', 'Unknown'), iter(discovery.get('parameters', {}).items())
+
+
+def _streamed_parameters(filepath):
+    """Like _load_parameters, but streaming the file with ijson"""
+    with open(filepath, 'rb') as f:
+        plugin_name = next(ijson.items(f, 'plugin'), 'Unknown')
+    return plugin_name, _stream_parameters(filepath)
+
+
+def _check_parameters(plugin_name, parameters, lines):
+    """Append the readiness report for parameters to lines; True if ready"""
+    lines.append(f"\n🔍 Validating: {plugin_name}")
         
-        if not parameters:
-            print("❌ No parameters found!")
-            return False
-            
-        issues = []
-        ready_count = 0
+    issues = []
+    ready_count = 0
+    total_params = 0
+    
+    for param_name, param_info in parameters:
+        total_params += 1
+        param_type = param_info.get('type')
         
-        for param_name, param_info in parameters.items():
-            param_type = param_info.get('type')
-            
-            # Check string numeric parameters
-            if param_type == 'string_numeric':
-                if not param_info.get('format'):
-                    issues.append(f"  - {param_name}: Missing string format")
-                else:
-                    ready_count += 1
-                    
-            # Check ranges
-            param_range = param_info.get('range', [None, None])
-            if param_range == [None, None] or None in param_range:
-                issues.append(f"  - {param_name}: Missing range values")
-                
-            # Check valid values for choice parameters
-            if param_type == 'string_list' and not param_info.get('valid_values'):
-                issues.append(f"  - {param_name}: Missing valid values list")
+        # Check string numeric parameters
+        if param_type == 'string_numeric':
+            if not param_info.get('format'):
+                issues.append(f"  - {param_name}: Missing string format")
+            else:
+                ready_count += 1
                 
-        # Report results
-        total_params = len(parameters)
-        if not issues:
-            print(f"✅ PHASE 2 READY! All {total_params} parameters properly discovered.")
-            return True
-        else:
-            print(f"❌ Not Phase 2 ready. {len(issues)} issues found:")
-            for issue in issues[:10]:  # Show first 10 issues
-                print(issue)
-            if len(issues) > 10:
-                print(f"  ... and {len(issues) - 10} more issues")
-            print(f"\n📊 Ready: {ready_count}/{total_params} parameters")
-            return False
+        # Check ranges
+        param_range = param_info.get('range', [None, None])
+        if param_range == [None, None] or None in param_range:
+            issues.append(f"  - {param_name}: Missing range values")
             
-    except Exception as e:
-        print(f"❌ Error validating file: {e}")
+        # Check valid values for choice parameters
+        if param_type == 'string_list' and not param_info.get('valid_values'):
+            issues.append(f"  - {param_name}: Missing valid values list")
+            
+    if not total_params:
+        lines.append("❌ No parameters found!")
         return False
         
+    # Report results
+    if not issues:
+        lines.append(f"✅ PHASE 2 READY! All {total_params} parameters properly discovered.")
+        return True
+    else:
+        lines.append(f"❌ Not Phase 2 ready. {len(issues)} issues found:")
+        lines.extend(issues[:10])  # Show first 10 issues
+        if len(issues) > 10:
+            lines.append(f"  ... and {len(issues) - 10} more issues")
+        lines.append(f"\n📊 Ready: {ready_count}/{total_params} parameters")
+        return False
+
+def check_discovery(filepath):
+    """Check a single discovery file for Phase 2 readiness.
+    
+    Returns (plugin_name, ready, lines) where lines is the report to print,
+    so files can be checked in worker processes and reported in order.
+    """
+    if ijson is not None:
+        try:
+            lines = []
+            plugin_name, parameters = _streamed_parameters(filepath)
+            return plugin_name, _check_parameters(plugin_name, parameters, lines), lines
+        except Exception:
+            # ijson is stricter than json (NaN/Infinity literals) and words
+            # its errors differently; let the whole-file load give the report
+            pass
+    
+    lines = []
+    plugin_name = 'Unknown'
+    try:
+        plugin_name, parameters = _load_parameters(filepath)
+        return plugin_name, _check_parameters(plugin_name, parameters, lines), lines
+    except Exception as e:
+        lines.append(f"❌ Error validating file: {e}")
+        return plugin_name, False, lines
+
+
+def validate_discovery(filepath):
+    """Validate a single discovery file for Phase 2 readiness"""
+    _, ready, lines = check_discovery(filepath)
+    print("\n".join(lines))
+    return ready
+        
 if __name__ == "__main__":
     if len(sys.argv) > 1:
         # Validate specific file
         validate_discovery(sys.argv[1])
     else:
-        # Validate all discoveries
+        # Validate all discoveries, parsing files in parallel
         discoveries_dir = Path.cwd() / "data" / "discoveries"
-        ready_count = 0
-        total_count = 0
+        paths = [p for p in discoveries_dir.glob("*.json") if 'corrupted' not in str(p)]
         
-        for discovery_file in discoveries_dir.glob("*.json"):
-            if 'corrupted' not in str(discovery_file):
-                total_count += 1
-                if validate_discovery(discovery_file):
-                    ready_count += 1
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(check_discovery, paths))
+        
+        ready_count = 0
+        for _, ready, lines in results:
+            print("\n".join(lines))
+            if ready:
+                ready_count += 1
                     
-        print(f"\n📊 Overall: {ready_count}/{total_count} plugins are Phase 2 ready")
+        print(f"\n📊 Overall: {ready_count}/{len(paths)} plugins are Phase 2 ready")